@@ -16,6 +16,7 @@ from custom_components.grohe_smarthome.entities.config_loader import ConfigLoade
 from custom_components.grohe_smarthome.entities.coordinator import (
     BlueHomeCoordinator,
     BlueProfCoordinator,
+    DashboardFetcher,
     GuardCoordinator,
     ProfileCoordinator,
     SenseCoordinator,
@@ -44,17 +45,14 @@ _LOGGER = logging.getLogger(__name__)
 
 
 def find_device_by_device_id(
-    hass: HomeAssistant, devices: list[GroheDevice], device_id: str
+    hass: HomeAssistant, devices: dict[str, GroheDevice], device_id: str
 ) -> GroheDevice:
     """Find Grohe device by device id."""
 
     registry = dr.async_get(hass)
     entry = registry.async_get(device_id)
     grohe_appliance_id = next(iter(entry.identifiers))[1]
-    return next(
-        (device for device in devices if device.appliance_id == grohe_appliance_id),
-        None,
-    )
+    return devices.get(grohe_appliance_id)
 
 
 async def async_unload_entry(ha: HomeAssistant, entry: ConfigEntry):
@@ -102,13 +100,19 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Get all devices available
     devices: list[GroheDevice] = await GroheDevice.get_devices(api)
+    device_by_appliance_id: dict[str, GroheDevice] = {
+        device.appliance_id: device for device in devices
+    }
+
+    # Device coordinators of this entry share one dashboard download per poll
+    dashboard = DashboardFetcher(ha, api)
 
     polling = entry.options.get("polling", 900)
     coordinators: dict[str, CoordinatorInterface] = {}
     for grohe_device in devices:
         if grohe_device.type == GroheTypes.GROHE_SENSE:
             sense_coordinator = SenseCoordinator(
-                ha, DOMAIN, grohe_device, api, polling, log_response_data
+                ha, DOMAIN, grohe_device, api, dashboard, polling, log_response_data
             )
             coordinators[grohe_device.appliance_id] = sense_coordinator
         elif grohe_device.type == GroheTypes.GROHE_SENSE_GUARD:
@@ -120,6 +124,7 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
                 DOMAIN,
                 grohe_device,
                 api,
+                dashboard,
                 device.device_config,
                 polling,
                 log_response_data,
@@ -127,12 +132,12 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
             coordinators[grohe_device.appliance_id] = guard_coordinator
         elif grohe_device.type == GroheTypes.GROHE_BLUE_HOME:
             blue_home_coordinator = BlueHomeCoordinator(
-                ha, DOMAIN, grohe_device, api, polling, log_response_data
+                ha, DOMAIN, grohe_device, api, dashboard, polling, log_response_data
             )
             coordinators[grohe_device.appliance_id] = blue_home_coordinator
         elif grohe_device.type == GroheTypes.GROHE_BLUE_PROFESSIONAL:
             blue_prof_coordinator = BlueProfCoordinator(
-                ha, DOMAIN, grohe_device, api, polling, log_response_data
+                ha, DOMAIN, grohe_device, api, dashboard, polling, log_response_data
             )
             coordinators[grohe_device.appliance_id] = blue_prof_coordinator
 
@@ -145,6 +150,7 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
     ha.data[DOMAIN][entry.entry_id] = {
         "session": api,
         "devices": devices,
+        "device_by_appliance_id": device_by_appliance_id,
         "coordinator": coordinators,
         "notifications": notifications,
         "config": config,
@@ -194,7 +200,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def handle_get_appliance_data(call: ServiceCall) -> ServiceResponse:
         _LOGGER.debug("Get data for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
         group_by_str = (
             call.data.get("group_by").lower() if call.data.get("group_by") else None
         )
@@ -240,7 +248,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def handle_get_appliance_details(call: ServiceCall) -> ServiceResponse:
         _LOGGER.debug("Get details for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
 
         if device:
             try:
@@ -254,7 +264,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def handle_get_appliance_command(call: ServiceCall) -> ServiceResponse:
         _LOGGER.debug("Get possible commands for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
 
         if device:
             try:
@@ -272,7 +284,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def handle_set_appliance_command(call: ServiceCall) -> ServiceResponse:
         _LOGGER.debug("Set commands for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
         commands = call.data.get("commands")
 
         data_to_send = {"command": commands}
@@ -296,7 +310,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def handle_tap_water(call: ServiceCall) -> ServiceResponse:
         _LOGGER.debug("Tap water for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
         water_type = call.data.get("water_type")
         water_amount = call.data.get("amount")
 
@@ -332,7 +348,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def handle_get_appliance_status(call: ServiceCall) -> ServiceResponse:
         _LOGGER.debug("Get status for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
 
         if device:
             try:
@@ -352,7 +370,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def handle_get_appliance_notifications(call: ServiceCall) -> ServiceResponse:
         _LOGGER.debug("Get notifications for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
 
         if device:
             try:
@@ -377,7 +397,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
         call: ServiceCall,
     ) -> ServiceResponse:
         _LOGGER.debug("Get pressure measurement for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
 
         if device:
             try:
@@ -420,7 +442,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def handle_set_snooze(call: ServiceCall) -> ServiceResponse:
         _LOGGER.debug("Set snooze for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
         duration = call.data.get("duration")
 
         if device and (device.type == GroheTypes.GROHE_SENSE_GUARD):
@@ -441,7 +465,9 @@ async def async_setup_entry(ha: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def handle_disable_snooze(call: ServiceCall) -> ServiceResponse:
         _LOGGER.debug("Disable snooze for params: %s", call.data)
-        device = find_device_by_device_id(ha, devices, call.data.get("device_id")[0])
+        device = find_device_by_device_id(
+            ha, device_by_appliance_id, call.data.get("device_id")[0]
+        )
 
         if device and (device.type == GroheTypes.GROHE_SENSE_GUARD):
             try:
@@ -663,6 +689,15 @@ async def async_remove_config_entry_device(
             if not any(device.appliance_id in t for t in device_entry.identifiers)
         ]
 
+        # Keep the lookup used by the platforms and services in sync
+        device_by_appliance_id: dict[str, GroheDevice] = ha.data[DOMAIN][
+            config_entry.entry_id
+        ].get("device_by_appliance_id")
+        device_by_appliance_id.clear()
+        device_by_appliance_id.update(
+            {device.appliance_id: device for device in devices}
+        )
+
         _LOGGER.debug(
             "All remaining device %s",
             str(ha.data[DOMAIN][config_entry.entry_id].get("devices")),
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Dict
 import logging
 from homeassistant.config_entries import ConfigEntry
@@ -18,16 +19,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     _LOGGER.debug(f'Adding binary sensor entities from config entry {entry}')
 
     data = hass.data[DOMAIN][entry.entry_id]
-    devices: List[GroheDevice] = data['devices']
+    devices: Dict[str, GroheDevice] = data['device_by_appliance_id']
     config: ConfigDto = data['config']
     coordinators: Dict[str, CoordinatorInterface] = data['coordinator']
     helper: EntityHelper = EntityHelper(config, DOMAIN)
 
-    entities: List[BinarySensor] = []
-    for device in devices:
-        coordinator = coordinators.get(device.appliance_id, None)
-        if coordinator is not None:
-            entities.extend(await helper.add_binary_sensor_entities(coordinator, device))
+    # Initial values are fetched per device, so set up all devices concurrently
+    results = await asyncio.gather(*[helper.add_binary_sensor_entities(coordinator, devices[appliance_id])
+                                     for appliance_id, coordinator in coordinators.items() if appliance_id in devices])
+    entities: List[BinarySensor] = [entity for device_entities in results for entity in device_entities]
 
     if entities:
         async_add_entities(entities)
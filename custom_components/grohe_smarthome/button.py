@@ -19,15 +19,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     _LOGGER.debug(f'Adding button entities from config entry {entry}')
 
     data = hass.data[DOMAIN][entry.entry_id]
-    devices: List[GroheDevice] = data['devices']
+    devices: Dict[str, GroheDevice] = data['device_by_appliance_id']
     config: ConfigDto = data['config']
     coordinators: Dict[str, CoordinatorInterface] = data['coordinator']
     helper: EntityHelper = EntityHelper(config, DOMAIN)
 
     entities: List[Button] = []
-    for device in devices:
-        coordinator = coordinators.get(device.appliance_id, None)
-        if coordinator is not None:
+    for appliance_id, coordinator in coordinators.items():
+        device = devices.get(appliance_id)
+        if device is not None:
             entities.extend(await helper.add_button_entities(coordinator, device))
 
     if entities:
@@ -0,0 +1,11 @@
+from typing import Any, Dict, TypedDict
+
+
+class ProfilePayload(TypedDict):
+    # Paged response with the entries under 'notifications'; None if the request failed
+    notifications: Dict[str, Any] | None
+
+
+class SensePayload(TypedDict):
+    details: Dict[str, Any]
+    status: Dict[str, Any] | None
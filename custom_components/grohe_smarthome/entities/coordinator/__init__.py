@@ -2,6 +2,7 @@
 
 from .blue_home_coordinator import BlueHomeCoordinator
 from .blue_prof_coordinator import BlueProfCoordinator
+from .dashboard_fetcher import DashboardFetcher
 from .guard_coordinator import GuardCoordinator
 from .profile_coordinator import ProfileCoordinator
 from .sense_coordinator import SenseCoordinator
@@ -9,6 +10,7 @@ from .sense_coordinator import SenseCoordinator
 __all__ = [
     "BlueHomeCoordinator",
     "BlueProfCoordinator",
+    "DashboardFetcher",
     "GuardCoordinator",
     "ProfileCoordinator",
     "SenseCoordinator",
@@ -1,69 +1,57 @@
 """Coordinator for Grohe Blue Home devices."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 from typing import Any, cast
 
-from benedict import benedict
 from custom_components.grohe_smarthome.dto.grohe_device import GroheDevice
-from custom_components.grohe_smarthome.dto.notification_dto import Notification
-from custom_components.grohe_smarthome.entities.interface.coordinator_button_interface import (
-    CoordinatorButtonInterface,
+from custom_components.grohe_smarthome.entities.coordinator.dashboard_fetcher import (
+    DashboardFetcher,
 )
-from custom_components.grohe_smarthome.entities.interface.coordinator_interface import (
-    CoordinatorInterface,
+from custom_components.grohe_smarthome.entities.coordinator.device_coordinator import (
+    DeviceCoordinator,
 )
-from grohe import GroheClient
-import httpx
+from grohe import GroheClient, GroheTypes
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class BlueHomeCoordinator(
-    DataUpdateCoordinator,
-    CoordinatorInterface,
-    CoordinatorButtonInterface,
-):
+class BlueHomeCoordinator(DeviceCoordinator):
     """Coordinator for Grohe Blue Home devices."""
 
+    # The client writes the device type into the command body, so the shared
+    # body already carries the type it would be set to
+    _REFRESH_BODY: dict[str, Any] = {
+        "type": GroheTypes.GROHE_BLUE_HOME.value,
+        "command": {"get_current_measurement": True},
+    }
+
     def __init__(
         self,
         hass: HomeAssistant,
         domain: str,
         device: GroheDevice,
         api: GroheClient,
+        dashboard: DashboardFetcher,
         polling: int = 300,
         log_response_data: bool = False,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
-            hass,
-            _LOGGER,
-            name="Grohe Sense",
-            update_interval=timedelta(seconds=polling),
-            always_update=True,
+            hass, _LOGGER, domain, device, api, dashboard, polling, log_response_data
         )
 
-        self._api = api
-        self._domain = domain
-        self._device = device
-        self._last_update = dt_util.now()
-        self._notifications: list[Notification] = []
-        self._log_response_data = log_response_data
-
-        self._key_path_for_timestamp = "details.data_latest.measurement.timestamp"
+        self._ts_path = ("data_latest", "measurement", "timestamp")
         self._last_measurement_timestamp = None
-        self._refresh_task_running: bool = False
 
-        # Timeout and poll interval for background refresh
+        # Timeout and backoff schedule for background refresh
         # Integration polling has in options min 40s
         self._update_timeout = 30
-        self._poll_interval = 10
+        self._poll_delays = (1, 2, 4, 8, 15)
 
     async def _get_data(self) -> dict[str, Any]:
         """Get data from the device."""
@@ -95,24 +83,18 @@ class BlueHomeCoordinator(
 
         self._last_update = dt_util.now()
 
-        if not self._refresh_task_running:
-            self.hass.async_create_task(self._async_refresh_and_verify())
+        self._start_refresh_workflow()
 
         return current_data
 
-    async def _fetch_device_data(self) -> dict[str, Any]:
+    async def _fetch_device_data(self, fresh: bool = False) -> dict[str, Any]:
         """Retrieve data from the device."""
-        api_data = await self._api.get_appliance_details(
-            cast(str, self._device.location_id),
-            cast(str, self._device.room_id),
-            self._device.appliance_id,
-        )
+        api_data = await self._get_appliance_details(fresh)
 
-        try:
-            status = {val["type"]: val["value"] for val in api_data.get("status", [])}
-        except Exception as err:
-            _LOGGER.debug("Status mapping failed: %s", err)
-            status = None
+        status_list = api_data.get("status") or []
+        status = (
+            {val["type"]: val["value"] for val in status_list} if status_list else None
+        )
 
         return {"details": api_data, "status": status}
 
@@ -123,20 +105,24 @@ class BlueHomeCoordinator(
         2. Periodically check for new data
         3. Update coordinator when new data arrives
         """
-        self._refresh_task_running = True
-
         try:
             old_ts = self._last_measurement_timestamp
 
             await self._send_refresh_command()
 
-            max_attempts = self._update_timeout // self._poll_interval
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self._update_timeout
+            max_attempts = len(self._poll_delays)
             attempts = 0
 
-            while attempts < max_attempts:
-                await asyncio.sleep(self._poll_interval)
+            for delay in self._poll_delays:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                await asyncio.sleep(min(delay, remaining))
                 attempts += 1
-                new_data = await self._fetch_device_data()
+                new_data = await self._fetch_device_data(fresh=True)
                 ts = self._extract_timestamp(new_data)
 
                 if ts and (old_ts is None or ts > old_ts):
@@ -169,91 +155,42 @@ class BlueHomeCoordinator(
                 err,
             )
 
-        finally:
-            self._refresh_task_running = False
-
     async def _send_refresh_command(self) -> None:
         """Send refresh command to device with retry."""
-        max_attempts = 3
-
-        for attempt in range(max_attempts):
-            try:
-                _LOGGER.debug(
-                    "Sending refresh command to %s (%s) - attempt %d/%d",
-                    self._device.name,
-                    self._device.appliance_id,
-                    attempt + 1,
-                    max_attempts,
-                )
-
-                await self._api.set_appliance_command(
-                    cast(str, self._device.location_id),
-                    cast(str, self._device.room_id),
-                    self._device.appliance_id,
-                    self._device.type,
-                    {"command": {"get_current_measurement": True}},
-                )
-
-            except httpx.ReadTimeout as err:
-                if attempt + 1 >= max_attempts:
-                    _LOGGER.error(
-                        "Refresh command failed after %d attempts for %s (%s): %s",
-                        max_attempts,
-                        self._device.name,
-                        self._device.appliance_id,
-                        err,
-                    )
-                    raise
-
-                _LOGGER.debug(
-                    "Refresh command timeout for %s (%s) - retry %d/%d: %s",
-                    self._device.name,
-                    self._device.appliance_id,
-                    attempt + 1,
-                    max_attempts,
-                    err,
-                )
-
-            else:
-                _LOGGER.debug(
-                    "Refresh command sent successfully to %s (%s)",
-                    self._device.name,
-                    self._device.appliance_id,
-                )
-                return
+        _LOGGER.debug(
+            "Sending refresh command to %s (%s)",
+            self._device.name,
+            self._device.appliance_id,
+        )
+
+        await self._with_timeout_retry(
+            lambda: self._api.set_appliance_command(
+                cast(str, self._device.location_id),
+                cast(str, self._device.room_id),
+                self._device.appliance_id,
+                self._device.type,
+                self._REFRESH_BODY,
+            )
+        )
+
+        _LOGGER.debug(
+            "Refresh command sent successfully to %s (%s)",
+            self._device.name,
+            self._device.appliance_id,
+        )
 
     def _extract_timestamp(self, data: dict[str, Any]) -> datetime | None:
         """Extracts the timestamp from the device data."""
         if not data:
             return None
 
-        wrapped = benedict({"details": data.get("details")})
-        ts_raw = wrapped.get(self._key_path_for_timestamp)
+        ts_raw: Any = data.get("details")
+        for key in self._ts_path:
+            ts_raw = ts_raw.get(key) if isinstance(ts_raw, dict) else None
+            if ts_raw is None:
+                break
 
         if not isinstance(ts_raw, str):
             return None
 
         return dt_util.parse_datetime(ts_raw)
-
-    async def get_initial_value(self) -> dict[str, Any]:
-        """Get the initial value of the device."""
-        return await self._fetch_device_data()
-
-    def set_polling_interval(self, polling: int) -> None:
-        """Set the polling interval."""
-        self.update_interval = timedelta(seconds=polling)
-        self.async_update_listeners()
-
-    def set_log_response_data(self, log_response_data: bool) -> None:
-        """Enable/disable response data logging."""
-        self._log_response_data = log_response_data
-
-    async def send_command(self, data_to_send: dict[str, Any]) -> dict[str, Any]:
-        """Send a command to the device."""
-        return await self._api.set_appliance_command(
-            cast(str, self._device.location_id),
-            cast(str, self._device.room_id),
-            self._device.appliance_id,
-            self._device.type,
-            data_to_send,
-        )
@@ -1,112 +1,104 @@
 import asyncio
 import logging
-from datetime import timedelta
-from typing import List, Dict
+from typing import Any, Dict
 from datetime import datetime
 
-from benedict import benedict
-from grohe import GroheClient
+from grohe import GroheClient, GroheTypes
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
 
 from custom_components.grohe_smarthome.dto.grohe_device import GroheDevice
-from custom_components.grohe_smarthome.dto.notification_dto import Notification
-from custom_components.grohe_smarthome.entities.interface.coordinator_button_interface import CoordinatorButtonInterface
-from custom_components.grohe_smarthome.entities.interface.coordinator_interface import CoordinatorInterface
+from custom_components.grohe_smarthome.entities.coordinator.dashboard_fetcher import DashboardFetcher
+from custom_components.grohe_smarthome.entities.coordinator.device_coordinator import DeviceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-class BlueProfCoordinator(DataUpdateCoordinator, CoordinatorInterface, CoordinatorButtonInterface):
-    def __init__(self, hass: HomeAssistant, domain: str, device: GroheDevice, api: GroheClient, polling: int = 300, log_response_data: bool = False) -> None:
-        super().__init__(hass, _LOGGER, name='Grohe Sense', update_interval=timedelta(seconds=polling), always_update=True)
-        self._api = api
-        self._domain = domain
-        self._device = device
-        self._timezone = datetime.now().astimezone().tzinfo
-        self._last_update = datetime.now().astimezone().replace(tzinfo=self._timezone)
-        self._notifications: List[Notification] = []
-        self._log_response_data = log_response_data
-
-        self._key_path_for_timestamp = 'details.data_latest_measurement.timestamp'
+class BlueProfCoordinator(DeviceCoordinator):
+    # The client writes the device type into the command body, so the shared body already carries the type it would be set to
+    _REFRESH_BODY = {'type': GroheTypes.GROHE_BLUE_PROFESSIONAL.value, 'command': {'get_current_measurement': True}}
+
+    def __init__(self, hass: HomeAssistant, domain: str, device: GroheDevice, api: GroheClient, dashboard: DashboardFetcher, polling: int = 300, log_response_data: bool = False) -> None:
+        super().__init__(hass, _LOGGER, domain, device, api, dashboard, polling, log_response_data)
+
+        self._ts_path = ('data_latest_measurement', 'timestamp')
         self._last_measurement_timestamp: datetime | None = None
-        self._last_measurement_updated: bool = False
         self._update_timeout = 10
         self._update_interval = 1
 
-    async def _get_data(self) -> Dict[str, any]:
+    async def _get_data(self) -> Dict[str, Any]:
+        return await self._fetch_device_data()
 
-        self._last_measurement_updated = False
+    async def _fetch_device_data(self, fresh: bool = False) -> Dict[str, Any]:
+        api_data = await self._get_appliance_details(fresh)
 
-        # Before each call, get the new current measurement
-        await self._api.set_appliance_command(
-            self._device.location_id,
-            self._device.room_id,
-            self._device.appliance_id,
-            self._device.type,
-            {'command': {'get_current_measurement': True}})
+        status_list = api_data.get('status') or []
+        status = { val['type']: val['value'] for val in status_list } if status_list else None
 
-        command_send_at: datetime = datetime.now().astimezone()
+        data = {'details': api_data, 'status': status}
+        return data
 
-        while datetime.now().astimezone() - command_send_at < timedelta(seconds=self._update_timeout):
-            api_data = await self._api.get_appliance_details(
+    async def _async_refresh_and_verify(self) -> None:
+        try:
+            # Before each refresh, ask the device for a new current measurement
+            await self._with_timeout_retry(lambda: self._api.set_appliance_command(
                 self._device.location_id,
                 self._device.room_id,
-                self._device.appliance_id)
+                self._device.appliance_id,
+                self._device.type,
+                self._REFRESH_BODY))
 
-            data = benedict(api_data)
-            if data.get(self._key_path_for_timestamp) is not None:
-                data_set_timestamp = datetime.fromisoformat(data.get(self._key_path_for_timestamp)).astimezone()
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self._update_timeout
+            new_data = None
 
-                if self._last_measurement_timestamp is None or data_set_timestamp > self._last_measurement_timestamp:
-                    self._last_measurement_timestamp = data_set_timestamp
-                    self._last_measurement_updated = True
-                    break
+            while loop.time() < deadline:
+                new_data = await self._fetch_device_data(fresh=True)
 
-            await asyncio.sleep(self._update_interval)
+                data_set_timestamp = self._extract_timestamp(new_data)
+                if data_set_timestamp is not None:
+                    if self._last_measurement_timestamp is None or data_set_timestamp > self._last_measurement_timestamp:
+                        self._last_measurement_timestamp = data_set_timestamp
+                        self.async_set_updated_data(new_data)
+                        return
+
+                await asyncio.sleep(self._update_interval)
 
-        if not self._last_measurement_updated:
             _LOGGER.warning(
-                f'No new measurement found for device {self._device.type} with name {self._device.name} (appliance = {self._device.appliance_id}) after {self._update_timeout} seconds.')
+                'No new measurement found for device %s with name %s (appliance = %s) after %s seconds.',
+                self._device.type, self._device.name, self._device.appliance_id, self._update_timeout)
 
-        try:
-            status = { val['type']: val['value'] for val in api_data['status'] }
-        except AttributeError as e:
-            _LOGGER.debug(f'Status could not be mapped: {e}')
-            status = None
+            # Status values may still have changed without a new measurement
+            if new_data is not None and new_data != self.data:
+                self.async_set_updated_data(new_data)
 
-        data = {'details': api_data, 'status': status}
-        return data
+        except Exception as e:
+            _LOGGER.error('Error in refresh workflow for %s (appliance = %s): %s', self._device.name, self._device.appliance_id, e)
+
+    def _extract_timestamp(self, data: Dict[str, Any]) -> datetime | None:
+        node = data.get('details')
+        for key in self._ts_path:
+            node = node.get(key) if isinstance(node, dict) else None
+            if node is None:
+                break
+
+        return dt_util.parse_datetime(node) if isinstance(node, str) else None
 
     async def _async_update_data(self) -> dict:
         try:
-            _LOGGER.debug(f'Updating device data for device {self._device.type} with name {self._device.name} (appliance = {self._device.appliance_id})')
-            data = await self._get_data()
+            _LOGGER.debug('Updating device data for device %s with name %s (appliance = %s)', self._device.type, self._device.name, self._device.appliance_id)
+            data = self.data if self.data is not None else await self._fetch_device_data()
 
             if self._log_response_data:
-                _LOGGER.debug(f'Response data for {self._device.name} (appliance = {self._device.appliance_id}): {data}')
+                _LOGGER.debug('Response data for %s (appliance = %s): %s', self._device.name, self._device.appliance_id, data)
+
+            self._last_update = dt_util.now()
+
+            self._start_refresh_workflow()
 
-            self._last_update = datetime.now().astimezone().replace(tzinfo=self._timezone)
             return data
 
         except Exception as e:
             _LOGGER.error("Error updating Grohe Blue Professional data: %s", str(e))
-
-    async def get_initial_value(self) -> Dict[str, any]:
-        return await self._get_data()
-
-    def set_polling_interval(self, polling: int) -> None:
-        self.update_interval = timedelta(seconds=polling)
-        self.async_update_listeners()
-
-    def set_log_response_data(self, log_response_data: bool) -> None:
-        self._log_response_data = log_response_data
-
-    async def send_command(self, data_to_send: Dict[str, any]) -> Dict[str, any]:
-        api_data = await self._api.set_appliance_command(
-            self._device.location_id,
-            self._device.room_id,
-            self._device.appliance_id,
-            self._device.type, data_to_send)
-
-        return api_data
\ No newline at end of file
+            # Keep the last known data so entities do not fall back to unknown
+            return self.data
@@ -0,0 +1,115 @@
+"""Base coordinator for Grohe data that is cached between requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Mapping
+
+from custom_components.grohe_smarthome.entities.coordinator.polling_coordinator import (
+    PollingCoordinator,
+)
+import httpx
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from grohe import GroheClient
+
+
+class CachedCoordinator(PollingCoordinator):
+    """Share running requests and keep the last response for entity setup.
+
+    Scheduled updates always request new data. Only get_initial_value is
+    served from the cache, and revalidates it in the background once it gets
+    old, so adding several platforms does not request the same data again.
+    """
+
+    __slots__ = ("_cached", "_fresh_ttl", "_swr_ttl", "_inflight", "_refresh_task")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: logging.Logger,
+        name: str,
+        subject: str,
+        api: GroheClient,
+        domain: str,
+        polling: int = 300,
+        log_response_data: bool = False,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass, logger, name, subject, api, domain, polling, log_response_data
+        )
+
+        self._cached: tuple[Mapping[str, Any], float] | None = None
+        self._fresh_ttl = 30
+        self._swr_ttl = 60
+        self._inflight: asyncio.Task | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    async def _request_data(self) -> Mapping[str, Any]:
+        """Request the data of this coordinator from the API."""
+        raise NotImplementedError
+
+    async def _get_data(self) -> Mapping[str, Any]:
+        """Return cached data, revalidating it in the background once it gets old."""
+        if self._cached is not None:
+            data, fetched_at = self._cached
+            age = self.hass.loop.time() - fetched_at
+            if age < self._fresh_ttl:
+                return data
+            if age < self._fresh_ttl + self._swr_ttl:
+                self._start_refresh()
+                # The refresh may already have finished if its task ran eagerly
+                return self._cached[0]
+
+        return await self._fetch_data()
+
+    def _start_refresh(self) -> None:
+        """Start a background refresh unless one is still running."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        self._refresh_task = self.hass.async_create_background_task(
+            self._refresh(), name=f"grohe_refresh_{self._subject}"
+        )
+
+    async def _refresh(self) -> None:
+        """Fetch new data and hand it to the listeners if it changed."""
+        try:
+            data = await self._fetch_data()
+        except (TimeoutError, httpx.HTTPError, ValueError) as err:
+            self.logger.error("Error refreshing %s: %s", self._subject, err)
+            return
+
+        # async_set_updated_data notifies listeners even if nothing changed
+        if data != self.data:
+            self.async_set_updated_data(data)
+
+    async def _fetch_data(self) -> Mapping[str, Any]:
+        """Request new data, sharing a request that is already running."""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = self.hass.async_create_task(
+                self._request_and_cache(), name=f"grohe_fetch_{self._subject}"
+            )
+
+        return await asyncio.shield(self._inflight)
+
+    async def _request_and_cache(self) -> Mapping[str, Any]:
+        """Request new data and remember it for get_initial_value."""
+        data = await self._request_data()
+        self._cached = (data, self.hass.loop.time())
+        return data
+
+    async def get_initial_value(self) -> Mapping[str, Any]:
+        """Get the initial value, served from the cache when it is recent."""
+        return await self._get_data()
+
+    async def async_shutdown(self) -> None:
+        """Cancel a running background refresh when the coordinator shuts down."""
+        await super().async_shutdown()
+
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
@@ -0,0 +1,79 @@
+"""Shared dashboard download for all coordinators of a config entry."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from grohe import GroheClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DashboardFetcher:
+    """Download the household dashboard once and hand out appliance details.
+
+    The Grohe API has no per-appliance details endpoint, so every details
+    request downloads the full dashboard. Coordinators polling at the same
+    time share one download instead of each fetching their own copy.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: GroheClient, ttl: float = 10) -> None:
+        """Initialize the fetcher."""
+        self._hass = hass
+        self._api = api
+        self._ttl = ttl
+        self._cached: tuple[dict[str, Any], float] | None = None
+        self._inflight: asyncio.Task | None = None
+
+    async def get_dashboard(self, fresh: bool = False) -> dict[str, Any]:
+        """Return the dashboard, downloading it when the cached copy is too old."""
+        if not fresh and self._cached is not None:
+            dashboard, fetched_at = self._cached
+            if self._hass.loop.time() - fetched_at < self._ttl:
+                return dashboard
+
+        # Concurrent callers share the request that is already running
+        if self._inflight is None or self._inflight.done():
+            self._inflight = self._hass.async_create_task(
+                self._request_dashboard(), name="grohe_fetch_dashboard"
+            )
+
+        return await asyncio.shield(self._inflight)
+
+    async def _request_dashboard(self) -> dict[str, Any]:
+        """Download the dashboard and remember it."""
+        dashboard = await self._api.get_dashboard()
+        if dashboard is None:
+            # The client returns None for every non-2xx response
+            raise ValueError("Dashboard request failed")
+
+        self._cached = (dashboard, self._hass.loop.time())
+        return dashboard
+
+    async def get_appliance_details(
+        self,
+        location_id: str,
+        room_id: str,
+        appliance_id: str,
+        fresh: bool = False,
+    ) -> dict[str, Any]:
+        """Return the details of a single appliance from the dashboard."""
+        dashboard = await self.get_dashboard(fresh)
+
+        for location in dashboard.get("locations") or []:
+            if location.get("id") != location_id:
+                continue
+            for room in location.get("rooms") or []:
+                if room.get("id") != room_id:
+                    continue
+                for appliance in room.get("appliances") or []:
+                    if appliance.get("appliance_id") == appliance_id:
+                        return appliance
+
+        _LOGGER.error("Appliance with ID %s not found in dashboard data", appliance_id)
+        return {}
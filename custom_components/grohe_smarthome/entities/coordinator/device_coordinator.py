@@ -0,0 +1,127 @@
+"""Base coordinator for Grohe devices that accept commands."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from custom_components.grohe_smarthome.dto.grohe_device import GroheDevice
+from custom_components.grohe_smarthome.entities.coordinator.dashboard_fetcher import (
+    DashboardFetcher,
+)
+from custom_components.grohe_smarthome.entities.coordinator.polling_coordinator import (
+    PollingCoordinator,
+)
+from custom_components.grohe_smarthome.entities.interface.coordinator_button_interface import (
+    CoordinatorButtonInterface,
+)
+from grohe import GroheClient
+import httpx
+
+from homeassistant.core import HomeAssistant
+
+
+class DeviceCoordinator(PollingCoordinator, CoordinatorButtonInterface):
+    """Shared state and helpers for a single Grohe appliance."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: logging.Logger,
+        domain: str,
+        device: GroheDevice,
+        api: GroheClient,
+        dashboard: DashboardFetcher,
+        polling: int = 300,
+        log_response_data: bool = False,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            logger,
+            "Grohe Sense",
+            device.name,
+            api,
+            domain,
+            polling,
+            log_response_data,
+        )
+
+        self._dashboard = dashboard
+        self._device = device
+        self._refresh_task: asyncio.Task | None = None
+
+    async def _async_refresh_and_verify(self) -> None:
+        """Request and wait for a new measurement, if the device supports it."""
+
+    def _start_refresh_workflow(self) -> None:
+        """Start the background refresh workflow unless one is still running."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        self._refresh_task = self.hass.async_create_background_task(
+            self._async_refresh_and_verify(),
+            name=f"grohe_refresh_{self._device.appliance_id}",
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending refresh workflow when the coordinator shuts down."""
+        await super().async_shutdown()
+
+        task = self._refresh_task
+        if task is None or task.done():
+            return
+
+        _, pending = await asyncio.wait({task}, timeout=5)
+        if pending:
+            task.cancel()
+
+    async def _get_appliance_details(self, fresh: bool = False) -> dict[str, Any]:
+        """Get the details of this appliance from the shared dashboard."""
+        return await self._dashboard.get_appliance_details(
+            self._device.location_id,
+            self._device.room_id,
+            self._device.appliance_id,
+            fresh,
+        )
+
+    async def _with_timeout_retry(
+        self,
+        request: Callable[[], Awaitable[Any]],
+        attempts: int = 3,
+    ) -> Any:
+        """Await a request, retrying it when it times out.
+
+        The timeout itself is the one configured on the shared httpx client.
+        """
+        for attempt in range(1, attempts + 1):
+            try:
+                return await request()
+            except httpx.TimeoutException as err:
+                if attempt >= attempts:
+                    raise
+
+                self.logger.debug(
+                    "Request for %s (%s) timed out - retry %d/%d: %s",
+                    self._device.name,
+                    self._device.appliance_id,
+                    attempt,
+                    attempts,
+                    err,
+                )
+
+        return None
+
+    async def get_initial_value(self) -> dict[str, Any]:
+        """Get the initial value of the device."""
+        return await self._get_data()
+
+    async def send_command(self, data_to_send: dict[str, Any]) -> dict[str, Any]:
+        """Send a command to the device."""
+        return await self._api.set_appliance_command(
+            self._device.location_id,
+            self._device.room_id,
+            self._device.appliance_id,
+            self._device.type,
+            data_to_send,
+        )
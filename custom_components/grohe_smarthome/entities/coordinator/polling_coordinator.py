@@ -0,0 +1,83 @@
+"""Base coordinator for all Grohe coordinators of a config entry."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from custom_components.grohe_smarthome.entities.interface.coordinator_interface import (
+    CoordinatorInterface,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from grohe import GroheClient
+
+
+class PollingCoordinator(DataUpdateCoordinator, CoordinatorInterface):
+    """Polling interval and logging options shared by all coordinators."""
+
+    # DataUpdateCoordinator keeps a __dict__, so these only list the added attributes
+    __slots__ = ("_api", "_domain", "_last_update", "_log_response_data", "_subject")
+
+    MIN_INTERVAL = 30
+    MAX_INTERVAL = 86400
+    # Level of the message logged when a polling interval has to be clamped
+    CLAMP_LOG_LEVEL = logging.WARNING
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: logging.Logger,
+        name: str,
+        subject: str,
+        api: GroheClient,
+        domain: str,
+        polling: int = 300,
+        log_response_data: bool = False,
+    ) -> None:
+        """Initialize the coordinator.
+
+        The subject names what is polled in log messages.
+        """
+        super().__init__(hass, logger, name=name, always_update=False)
+
+        self._api = api
+        self._domain = domain
+        self._subject = subject
+        self._last_update = dt_util.now()
+        self._log_response_data = log_response_data
+
+        # The configured interval is clamped the same way as later changes
+        self.update_interval = timedelta(seconds=self._clamp_polling(polling))
+
+    def _clamp_polling(self, polling: int) -> int:
+        """Clamp a polling interval to the supported range."""
+        interval = min(max(polling, self.MIN_INTERVAL), self.MAX_INTERVAL)
+        if interval != polling:
+            self.logger.log(
+                self.CLAMP_LOG_LEVEL,
+                "Polling interval of %s seconds is out of range for %s, using %s seconds",
+                polling,
+                self._subject,
+                interval,
+            )
+
+        return interval
+
+    def set_polling_interval(self, polling: int) -> None:
+        """Set the polling interval, clamped to the supported range."""
+        update_interval = timedelta(seconds=self._clamp_polling(polling))
+        if update_interval == self.update_interval:
+            return
+
+        self.update_interval = update_interval
+        self.async_update_listeners()
+
+    def set_log_response_data(self, log_response_data: bool) -> None:
+        """Enable/disable response data logging."""
+        self._log_response_data = log_response_data
@@ -1,63 +1,57 @@
+from __future__ import annotations
+
 import logging
-from datetime import timedelta
-from typing import Dict
-from datetime import datetime
+from typing import TYPE_CHECKING, Any, Mapping
 
-from grohe import GroheClient
+import httpx
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from custom_components.grohe_smarthome.dto.payload_dtos import ProfilePayload
+from custom_components.grohe_smarthome.entities.coordinator.cached_coordinator import CachedCoordinator
 
-from custom_components.grohe_smarthome.entities.interface.coordinator_interface import CoordinatorInterface
+if TYPE_CHECKING:
+    from grohe import GroheClient
 
 _LOGGER = logging.getLogger(__name__)
 
-class ProfileCoordinator(DataUpdateCoordinator, CoordinatorInterface):
-    def __init__(self, hass: HomeAssistant, domain: str, api: GroheClient, log_response_data: bool = False) -> None:
-        super().__init__(hass, _LOGGER, name='Grohe', update_interval=timedelta(seconds=900), always_update=True)
-        self._api = api
-        self._domain = domain
+class ProfileCoordinator(CachedCoordinator):
+    MIN_INTERVAL = 300
+    # Notifications change rarely, so a short device polling interval is expected to be raised here
+    CLAMP_LOG_LEVEL = logging.DEBUG
 
-        self._timezone = datetime.now().astimezone().tzinfo
-        self._last_update = datetime.now().astimezone().replace(tzinfo=self._timezone)
-        self._data: Dict[str, any] = {}
-        self._log_response_data = log_response_data
+    def __init__(self, hass: HomeAssistant, domain: str, api: GroheClient, log_response_data: bool = False) -> None:
+        super().__init__(hass, _LOGGER, 'Grohe', 'profile data', api, domain, 900, log_response_data)
 
-    async def _get_data(self) -> Dict[str, any]:
+    async def _request_data(self) -> ProfilePayload:
         api_data = await self._api.get_profile_notifications(50)
+        if api_data is None:
+            # The client returns None for every non-2xx response
+            raise ValueError('Profile notifications request failed')
 
-        data = {'notifications': api_data}
-        self._data = data
+        data: ProfilePayload = {'notifications': api_data}
         return data
 
-    def get_data(self) -> Dict[str, any]:
-        return self._data
+    def get_data(self) -> Mapping[str, Any]:
+        return self.data or {}
 
-    async def _async_update_data(self) -> dict:
+    async def _async_update_data(self) -> ProfilePayload | None:
         try:
-            _LOGGER.debug(f'Updating generic profile data for domain {self._domain}')
-            data = await self._get_data()
+            _LOGGER.debug('Updating generic profile data for domain %s', self._domain)
+            data = await self._fetch_data()
 
             if self._log_response_data:
-                _LOGGER.debug(f'Response data for Profile: {data}')
+                _LOGGER.debug('Response data for Profile: %s', data)
 
-            self._last_update = datetime.now().astimezone().replace(tzinfo=self._timezone)
+            self._last_update = dt_util.now()
             return data
 
-        except Exception as e:
+        except (TimeoutError, httpx.HTTPError, ValueError) as e:
             _LOGGER.error("Error updating Profile data: %s", str(e))
-
-    async def _async_setup(self) -> None:
-        await self._async_update_data()
+            # Keep the last known data so entities do not fall back to unknown
+            return self.data
 
     async def update_notification(self, notification_id: str, state: bool) -> None:
         await self._api.update_profile_notification_state(notification_id, state)
-
-    async def get_initial_value(self) -> Dict[str, any]:
-        return await self._get_data()
-
-    def set_polling_interval(self, polling: int) -> None:
-        self.update_interval = timedelta(seconds=polling)
-        self.async_update_listeners()
-
-    def set_log_response_data(self, log_response_data: bool) -> None:
-        self._log_response_data = log_response_data
\ No newline at end of file
+        # The cache must not hand out the state from before this change
+        self._cached = None
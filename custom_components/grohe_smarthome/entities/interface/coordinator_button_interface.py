@@ -1,8 +1,8 @@
 from abc import abstractmethod
-from typing import Dict
+from typing import Any, Dict
 
 
 class CoordinatorButtonInterface:
     @abstractmethod
-    async def send_command(self, data_to_send: Dict[str, any]) -> Dict[str, any]:
+    async def send_command(self, data_to_send: Dict[str, Any]) -> Dict[str, Any]:
         raise NotImplementedError
@@ -1,14 +1,14 @@
 from abc import abstractmethod
-from typing import Dict
+from typing import Any, Mapping
 
 
 class CoordinatorInterface:
     @abstractmethod
-    async def _get_data(self) -> Dict[str, any]:
+    async def _get_data(self) -> Mapping[str, Any]:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_initial_value(self) -> Dict[str, any]:
+    async def get_initial_value(self) -> Mapping[str, Any]:
         raise NotImplementedError
 
     @abstractmethod
@@ -1,12 +1,12 @@
 from abc import abstractmethod
-from typing import Dict
+from typing import Any, Dict
 
 
 class CoordinatorValveInterface:
     @abstractmethod
-    async def set_valve(self, data_to_set: Dict[str, any]) -> Dict[str, any]:
+    async def set_valve(self, data_to_set: Dict[str, Any]) -> Dict[str, Any]:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_valve_value(self) -> Dict[str, any]:
+    async def get_valve_value(self) -> Dict[str, Any]:
         raise NotImplementedError
\ No newline at end of file